@@ -42,8 +42,13 @@ Wood pricing:
         the relative importance for the 20-20-20 goals):
         Working Group 2: Methodology. Statistics Austria;
         Statistical Office of the Republic of Slovenia.
+
+The default plans and prices are built once and cached, so every caller
+shares the same model instances. Use model_copy() before altering one.
 """
 
+from functools import lru_cache
+
 from ...models.energy_plans import (
     DieselPrice,
     ElectricityPlan,
@@ -56,6 +61,7 @@ from ...models.energy_plans import (
 )
 
 
+@lru_cache(maxsize=None)
 def get_default_electricity_plan():
     """
     Return a default electricity plan.
@@ -75,6 +81,7 @@ def get_default_electricity_plan():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_natural_gas_plan():
     """
     Return a default natural gas plan.
@@ -92,6 +99,7 @@ def get_default_natural_gas_plan():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_lpg_plan():
     """
     Return a default LPG plan.
@@ -106,6 +114,7 @@ def get_default_lpg_plan():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_wood_price():
     """
     Figures justified by:
@@ -138,6 +147,7 @@ def get_default_wood_price():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_petrol_price():
     """
     Return a default petrol plan.
@@ -151,6 +161,7 @@ def get_default_petrol_price():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_diesel_price():
     """
     Return a default diesel plan.
@@ -166,6 +177,7 @@ def get_default_diesel_price():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_public_ev_charger_rate():
     """
     Return a default public EV charger rate.
@@ -178,6 +190,7 @@ def get_default_public_ev_charger_rate():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_annual_non_energy_no_vehicle_costs():
     """
     Return a default set of annual non-energy costs
@@ -191,6 +204,7 @@ def get_default_annual_non_energy_no_vehicle_costs():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_annual_non_energy_petrol_vehicle_costs():
     """
     Return a default set of annual non-energy costs
@@ -204,6 +218,7 @@ def get_default_annual_non_energy_petrol_vehicle_costs():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_annual_non_energy_diesel_vehicle_costs():
     """
     Return a default set of annual non-energy costs
@@ -217,6 +232,7 @@ def get_default_annual_non_energy_diesel_vehicle_costs():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_annual_non_energy_hybrid_vehicle_costs():
     """
     Return a default set of annual non-energy costs
@@ -230,6 +246,7 @@ def get_default_annual_non_energy_hybrid_vehicle_costs():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_annual_non_energy_phev_costs():
     """
     Return a default set of annual non-energy costs
@@ -243,6 +260,7 @@ def get_default_annual_non_energy_phev_costs():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_annual_non_energy_electric_vehicle_costs():
     """
     Return a default set of annual non-energy costs
@@ -280,6 +298,9 @@ def get_default_plans():
     """
     Return a default set of energy plans.
 
+    The dictionary is new on each call, so callers may replace its
+    entries; the plans it holds are the shared cached instances.
+
     Returns
     -------
     dict
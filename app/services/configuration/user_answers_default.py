@@ -1,7 +1,12 @@
 """
 Default answers for the components of a household energy profile.
+
+Each default is constructed on first use and then reused; take a
+model_copy() of an answers object before changing any of its fields.
 """
 
+from functools import lru_cache
+
 from ...models.user_answers import (
     CooktopAnswers,
     DrivingAnswers,
@@ -14,6 +19,7 @@ from ...models.user_answers import (
 from ...services.energy_calculator import estimate_usage_from_profile
 
 
+@lru_cache(maxsize=None)
 def get_default_your_home_answers():
     """
     Return a default 'your home' answers object.
@@ -23,6 +29,7 @@ def get_default_your_home_answers():
     return YourHomeAnswers(people_in_house=3, postcode="6012", disconnect_gas=False)
 
 
+@lru_cache(maxsize=None)
 def get_default_heating_answers():
     """
     Return a default 'heating' answers object.
@@ -34,6 +41,7 @@ def get_default_heating_answers():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_hot_water_answers():
     """
     Return a default 'hot water' answers object.
@@ -44,6 +52,7 @@ def get_default_hot_water_answers():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_cooktop_answers():
     """
     Return a default 'cooktop' answers object.
@@ -53,6 +62,7 @@ def get_default_cooktop_answers():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_driving_answers():
     """
     Return a default 'driving' answers object.
@@ -64,6 +74,7 @@ def get_default_driving_answers():
     )
 
 
+@lru_cache(maxsize=None)
 def get_default_solar_answers():
     """
     Return a default 'solar' answers object.
@@ -76,6 +87,8 @@ def get_default_solar_answers():
 def get_default_household_answers():
     """
     Return a default overall household answers object.
+
+    A new dictionary is built on each call from the cached components.
     """
     return {
         "your_home": get_default_your_home_answers(),
@@ -87,6 +100,7 @@ def get_default_household_answers():
     }
 
 
+@lru_cache(maxsize=None)
 def get_default_usage_profile():
     """
     Return a default household yearly fuel usage profile.
@@ -2,9 +2,11 @@
 Script to generate lookup table for the deviate PHP web app.
 """
 
+import csv
 import itertools
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 
@@ -21,14 +23,15 @@ from app.models.user_answers import (
 )
 from app.services.energy_calculator import emissions_kg_co2e
 from app.services.get_climate_zone import climate_zone, postcode_dict
-from app.services.get_energy_plans import get_energy_plan
+from app.services.get_energy_plans import get_energy_plan, postcode_to_edb_zone
 
 logging.basicConfig(level=logging.INFO)
 
-# Constant for the lookup directory. Relative to the script location.
-LOOKUP_DIR = os.path.join(os.path.dirname(__file__), "..", "lookup")
+# Constant for the lookup directory. Relative to the script location,
+# resolved once to an absolute path so it does not depend on the
+# working directory or carry a ".." component.
+LOOKUP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "lookup"))
 DEFAULT_VEHICLE_TYPE = "None"
-REPORT_EVERY_N_ROWS = 1e5
 
 # Ensure the directory exists
 os.makedirs(LOOKUP_DIR, exist_ok=True)
@@ -71,9 +74,53 @@ has_solar = [True, False]  # Ignored for now
 
 # Cache for expensive functions
 energy_plan_cache = {}
-climate_zone_cache = {}
+plan_columns_cache = {}
 cost_emissions_cache = {}
 
+PLAN_COLUMNS = [
+    "climate_zone",
+    "electricity_plan_name",
+    "natural_gas_plan_name",
+    "lpg_plan_name",
+    "wood_price_name",
+    "petrol_price_name",
+    "diesel_price_name",
+]
+COST_EMISSIONS_COLUMNS = ["annual_variable_cost", "annual_kg_co2e"]
+HEATING_COLUMNS = [
+    *PLAN_COLUMNS,
+    "people_in_house",
+    "disconnect_gas",
+    "main_heating_source",
+    "heating_during_day",
+    "insulation_quality",
+    *COST_EMISSIONS_COLUMNS,
+]
+HOT_WATER_COLUMNS = [
+    *PLAN_COLUMNS,
+    "people_in_house",
+    "disconnect_gas",
+    "hot_water_usage",
+    "hot_water_heating_source",
+    *COST_EMISSIONS_COLUMNS,
+]
+COOKTOP_COLUMNS = [
+    *PLAN_COLUMNS,
+    "people_in_house",
+    "disconnect_gas",
+    "cooktop_type",
+    *COST_EMISSIONS_COLUMNS,
+]
+VEHICLE_COLUMNS = [
+    *PLAN_COLUMNS,
+    "people_in_house",
+    "disconnect_gas",
+    "vehicle_type",
+    "vehicle_size",
+    "km_per_week",
+    *COST_EMISSIONS_COLUMNS,
+]
+
 
 def clear_output_dir(output_dir):
     """
@@ -88,43 +135,98 @@ def uniquify_rows_and_write_to_csv(raw_df, filename):
     """
     Write unique rows to a CSV file.
     """
-    final_df = raw_df.drop_duplicates().reset_index(drop=True)
+    final_df = raw_df.drop_duplicates(ignore_index=True)
     logging.info("Deduplicating: %s distinct rows.", len(final_df))
     final_df.to_csv(filename, index=False)
     return final_df
 
 
+def write_rows_to_csv(rows, columns, filename):
+    """
+    Stream rows that are already distinct to a CSV file.
+
+    Rows are written as they are generated rather than collected into a
+    DataFrame first. Returns the number of rows written.
+    """
+    row_count = 0
+    with open(filename, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file, lineterminator="\n")
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+    logging.info("Wrote %s distinct rows.", row_count)
+    return row_count
+
+
 def get_energy_plan_cached(postcode, vehicle_type):
     """
     Cached version of energy_plan function.
+
+    Electricity and natural gas plans are assigned by EDB region, so all
+    postcodes in a region share one cached plan rather than each postcode
+    building its own.
     """
-    if postcode in energy_plan_cache:
-        return energy_plan_cache[(postcode, vehicle_type)]
+    cache_key = (postcode_to_edb_zone(postcode), vehicle_type)
+    if cache_key in energy_plan_cache:
+        return energy_plan_cache[cache_key]
     plan = get_energy_plan(postcode, vehicle_type)
-    energy_plan_cache[(postcode, vehicle_type)] = plan
+    energy_plan_cache[cache_key] = plan
     return plan
 
 
-def get_climate_zone_cached(postcode):
+def get_plan_columns_cached(postcode):
     """
-    Cached version of climate_zone function.
+    Cached climate zone and plan name columns for a postcode.
+
+    These columns are shared by every row generated for the postcode,
+    so they are built once rather than once per row. The values are
+    returned as a tuple in PLAN_COLUMNS order.
     """
-    if postcode in climate_zone_cache:
-        return climate_zone_cache[postcode]
-    zone = climate_zone(postcode)
-    climate_zone_cache[postcode] = zone
-    return zone
+    if postcode in plan_columns_cache:
+        return plan_columns_cache[postcode]
+    my_plan = get_energy_plan_cached(postcode, DEFAULT_VEHICLE_TYPE)
+    columns = (
+        climate_zone(postcode),
+        my_plan.electricity_plan.name,
+        my_plan.natural_gas_plan.name,
+        my_plan.lpg_plan.name,
+        my_plan.wood_price.name,
+        my_plan.petrol_price.name,
+        my_plan.diesel_price.name,
+    )
+    plan_columns_cache[postcode] = columns
+    return columns
+
+
+def get_representative_postcodes():
+    """
+    Return the first postcode for each distinct set of plan columns.
+
+    Rows generated for a postcode only depend on it through its plan
+    columns, so any other postcode with the same plan columns would
+    only produce duplicate rows. The postcodes are returned as a view of
+    the mapping in first-seen order, without copying them into a list.
+    """
+    representatives = {}
+    for postcode in postcodes:
+        representatives.setdefault(get_plan_columns_cached(postcode), postcode)
+    return representatives.values()
 
 
 def calculate_cost_and_emissions(your_home, answers):
     """
     Use the answers and postcode to calculate cost and emissions.
+
+    The postcode only affects the result through its climate zone and
+    energy plans, so the cache is keyed on those (via the plan columns)
+    rather than on the postcode itself. Postcodes that share a climate
+    zone and plans then reuse the same result.
     """
-    # Create a cache key based on the attributes of your_home and answers
     cache_key = (
         your_home.people_in_house,
-        your_home.postcode,
         your_home.disconnect_gas,
+        get_plan_columns_cached(your_home.postcode),
         tuple(sorted(answers.__dict__.items())),
     )
 
@@ -143,8 +245,8 @@ def calculate_cost_and_emissions(your_home, answers):
         "variable_cost_nzd": variable_cost_nzd,
         "emissions_kg_co2e": my_emissions_kg_co2e,
     }
-    cost_emissions_cache[cache_key] = (result, my_plan)
-    return (result, my_plan)
+    cost_emissions_cache[cache_key] = result
+    return result
 
 
 def generate_postcode_lookup_table():
@@ -153,245 +255,208 @@ def generate_postcode_lookup_table():
     """
     rows = []
     for postcode in postcodes:
-        my_plan = get_energy_plan_cached(postcode, DEFAULT_VEHICLE_TYPE)
-        my_climate_zone = get_climate_zone_cached(postcode)
-        row = {
-            "postcode": postcode,
-            "climate_zone": my_climate_zone,
-            "electricity_plan_name": my_plan.electricity_plan.name,
-            "natural_gas_plan_name": my_plan.natural_gas_plan.name,
-            "lpg_plan_name": my_plan.lpg_plan.name,
-            "wood_price_name": my_plan.wood_price.name,
-            "petrol_price_name": my_plan.petrol_price.name,
-            "diesel_price_name": my_plan.diesel_price.name,
-        }
-        rows.append(row)
-    postcode_df = pd.DataFrame(rows)
+        rows.append((postcode, *get_plan_columns_cached(postcode)))
+    postcode_df = pd.DataFrame(rows, columns=["postcode", *PLAN_COLUMNS])
     return uniquify_rows_and_write_to_csv(
         postcode_df,
         os.path.join(LOOKUP_DIR, "postcode_to_climate_and_energy_plans.csv"),
     )
 
 
-def generate_heating_lookup_table():
+def heating_lookup_rows():
     """
-    Generate the heating lookup table.
+    Yield the rows of the heating lookup table.
     """
-    heating_lookup = []
-    for combination in itertools.product(
-        people_in_house,
-        postcodes,
-        disconnect_gas,
-        main_heating_sources,
-        heating_during_day,
-        insulation_quality,
-    ):
-        (
-            people,
-            postcode,
-            disconnect,
-            heating_source,
-            heating_day,
-            insulation,
-        ) = combination
-
-        your_home = YourHomeAnswers(
-            people_in_house=people,
-            postcode=postcode,
-            disconnect_gas=disconnect,
-        )
-        heating = HeatingAnswers(
+    heating_answers = [
+        HeatingAnswers(
             main_heating_source=heating_source,
             heating_during_day=heating_day,
             insulation_quality=insulation,
         )
-        cost_emissions, my_plan = calculate_cost_and_emissions(your_home, heating)
-        my_climate_zone = get_climate_zone_cached(postcode)
-
-        row = {
-            "climate_zone": my_climate_zone,
-            "electricity_plan_name": my_plan.electricity_plan.name,
-            "natural_gas_plan_name": my_plan.natural_gas_plan.name,
-            "lpg_plan_name": my_plan.lpg_plan.name,
-            "wood_price_name": my_plan.wood_price.name,
-            "petrol_price_name": my_plan.petrol_price.name,
-            "diesel_price_name": my_plan.diesel_price.name,
-            "people_in_house": people,
-            "disconnect_gas": disconnect,
-            "main_heating_source": heating_source,
-            "heating_during_day": heating_day,
-            "insulation_quality": insulation,
-            "annual_variable_cost": cost_emissions["variable_cost_nzd"],
-            "annual_kg_co2e": cost_emissions["emissions_kg_co2e"],
-        }
-        heating_lookup.append(row)
+        for heating_source, heating_day, insulation in itertools.product(
+            main_heating_sources, heating_during_day, insulation_quality
+        )
+    ]
+    representative_postcodes = get_representative_postcodes()
+    for people in people_in_house:
+        for postcode, disconnect in itertools.product(
+            representative_postcodes, disconnect_gas
+        ):
+            your_home = YourHomeAnswers(
+                people_in_house=people,
+                postcode=postcode,
+                disconnect_gas=disconnect,
+            )
+            plan_columns = get_plan_columns_cached(postcode)
+            for heating in heating_answers:
+                cost_emissions = calculate_cost_and_emissions(your_home, heating)
+                yield (
+                    *plan_columns,
+                    people,
+                    disconnect,
+                    heating.main_heating_source,
+                    heating.heating_during_day,
+                    heating.insulation_quality,
+                    cost_emissions["variable_cost_nzd"],
+                    cost_emissions["emissions_kg_co2e"],
+                )
+
+        logging.info("Generated heating rows for %s people.", people)
 
-        if len(heating_lookup) % REPORT_EVERY_N_ROWS == 0:
-            logging.info("Appended %s rows to heating_lookup.", len(heating_lookup))
 
-    space_heating_df = pd.DataFrame(heating_lookup)
-    return uniquify_rows_and_write_to_csv(
-        space_heating_df, os.path.join(LOOKUP_DIR, "space_heating_lookup_table.csv")
+def generate_heating_lookup_table():
+    """
+    Generate the heating lookup table.
+    """
+    return write_rows_to_csv(
+        heating_lookup_rows(),
+        HEATING_COLUMNS,
+        os.path.join(LOOKUP_DIR, "space_heating_lookup_table.csv"),
     )
 
 
-def generate_hot_water_lookup_table():
+def hot_water_lookup_rows():
     """
-    Generate the hot water lookup table.
+    Yield the rows of the hot water lookup table.
     """
-    hot_water_rows = []
-    for combination in itertools.product(
-        people_in_house,
-        postcodes,
-        disconnect_gas,
-        hot_water_usage,
-        hot_water_heating_sources,
-    ):
-        people, postcode, disconnect, usage, heating_source = combination
-
-        your_home = YourHomeAnswers(
-            people_in_house=people,
-            postcode=postcode,
-            disconnect_gas=disconnect,
-        )
-        hot_water = HotWaterAnswers(
+    hot_water_answers = [
+        HotWaterAnswers(
             hot_water_usage=usage,
             hot_water_heating_source=heating_source,
         )
-        cost_emissions, my_plan = calculate_cost_and_emissions(your_home, hot_water)
-        my_climate_zone = get_climate_zone_cached(postcode)
-
-        row = {
-            "climate_zone": my_climate_zone,
-            "electricity_plan_name": my_plan.electricity_plan.name,
-            "natural_gas_plan_name": my_plan.natural_gas_plan.name,
-            "lpg_plan_name": my_plan.lpg_plan.name,
-            "wood_price_name": my_plan.wood_price.name,
-            "petrol_price_name": my_plan.petrol_price.name,
-            "diesel_price_name": my_plan.diesel_price.name,
-            "people_in_house": people,
-            "disconnect_gas": disconnect,
-            "hot_water_usage": usage,
-            "hot_water_heating_source": heating_source,
-            "annual_variable_cost": cost_emissions["variable_cost_nzd"],
-            "annual_kg_co2e": cost_emissions["emissions_kg_co2e"],
-        }
-        hot_water_rows.append(row)
+        for usage, heating_source in itertools.product(
+            hot_water_usage, hot_water_heating_sources
+        )
+    ]
+    representative_postcodes = get_representative_postcodes()
+    for people in people_in_house:
+        for postcode, disconnect in itertools.product(
+            representative_postcodes, disconnect_gas
+        ):
+            your_home = YourHomeAnswers(
+                people_in_house=people,
+                postcode=postcode,
+                disconnect_gas=disconnect,
+            )
+            plan_columns = get_plan_columns_cached(postcode)
+            for hot_water in hot_water_answers:
+                cost_emissions = calculate_cost_and_emissions(your_home, hot_water)
+                yield (
+                    *plan_columns,
+                    people,
+                    disconnect,
+                    hot_water.hot_water_usage,
+                    hot_water.hot_water_heating_source,
+                    cost_emissions["variable_cost_nzd"],
+                    cost_emissions["emissions_kg_co2e"],
+                )
+
+        logging.info("Generated hot water rows for %s people.", people)
 
-        if len(hot_water_rows) % REPORT_EVERY_N_ROWS == 0:
-            logging.info("Appended %s rows to hot_water_rows.", len(hot_water_rows))
 
-    hot_water_df = pd.DataFrame(hot_water_rows)
-    return uniquify_rows_and_write_to_csv(
-        hot_water_df, os.path.join(LOOKUP_DIR, "hot_water_lookup_table.csv")
+def generate_hot_water_lookup_table():
+    """
+    Generate the hot water lookup table.
+    """
+    return write_rows_to_csv(
+        hot_water_lookup_rows(),
+        HOT_WATER_COLUMNS,
+        os.path.join(LOOKUP_DIR, "hot_water_lookup_table.csv"),
     )
 
 
-def generate_cooktop_lookup_table():
+def cooktop_lookup_rows():
     """
-    Generate the cooktop lookup table.
+    Yield the rows of the cooktop lookup table.
     """
-    cooktop_rows = []
-    for combination in itertools.product(
-        people_in_house, postcodes, disconnect_gas, cooktop_types
-    ):
-        people, postcode, disconnect, cooktop_type = combination
-
-        your_home = YourHomeAnswers(
-            people_in_house=people,
-            postcode=postcode,
-            disconnect_gas=disconnect,
-        )
-        cooktop = CooktopAnswers(
-            cooktop=cooktop_type,
-        )
-        cost_emissions, my_plan = calculate_cost_and_emissions(your_home, cooktop)
-        my_climate_zone = get_climate_zone_cached(postcode)
-
-        row = {
-            "climate_zone": my_climate_zone,
-            "electricity_plan_name": my_plan.electricity_plan.name,
-            "natural_gas_plan_name": my_plan.natural_gas_plan.name,
-            "lpg_plan_name": my_plan.lpg_plan.name,
-            "wood_price_name": my_plan.wood_price.name,
-            "petrol_price_name": my_plan.petrol_price.name,
-            "diesel_price_name": my_plan.diesel_price.name,
-            "people_in_house": people,
-            "disconnect_gas": disconnect,
-            "cooktop_type": cooktop_type,
-            "annual_variable_cost": cost_emissions["variable_cost_nzd"],
-            "annual_kg_co2e": cost_emissions["emissions_kg_co2e"],
-        }
-        cooktop_rows.append(row)
+    cooktop_answers = [
+        CooktopAnswers(cooktop=cooktop_type) for cooktop_type in cooktop_types
+    ]
+    representative_postcodes = get_representative_postcodes()
+    for people in people_in_house:
+        for postcode, disconnect in itertools.product(
+            representative_postcodes, disconnect_gas
+        ):
+            your_home = YourHomeAnswers(
+                people_in_house=people,
+                postcode=postcode,
+                disconnect_gas=disconnect,
+            )
+            plan_columns = get_plan_columns_cached(postcode)
+            for cooktop in cooktop_answers:
+                cost_emissions = calculate_cost_and_emissions(your_home, cooktop)
+                yield (
+                    *plan_columns,
+                    people,
+                    disconnect,
+                    cooktop.cooktop,
+                    cost_emissions["variable_cost_nzd"],
+                    cost_emissions["emissions_kg_co2e"],
+                )
+
+        logging.info("Generated cooktop rows for %s people.", people)
 
-        if len(cooktop_rows) % REPORT_EVERY_N_ROWS == 0:
-            logging.info("Appended %s rows to cooktop_rows.", len(cooktop_rows))
 
-    cooktop_df = pd.DataFrame(cooktop_rows)
-    return uniquify_rows_and_write_to_csv(
-        cooktop_df, os.path.join(LOOKUP_DIR, "cooktop_lookup_table.csv")
+def generate_cooktop_lookup_table():
+    """
+    Generate the cooktop lookup table.
+    """
+    return write_rows_to_csv(
+        cooktop_lookup_rows(),
+        COOKTOP_COLUMNS,
+        os.path.join(LOOKUP_DIR, "cooktop_lookup_table.csv"),
     )
 
 
-def generate_vehicle_lookup_table():
+def vehicle_lookup_rows():
     """
-    Generate the vehicle lookup table.
+    Yield the rows of the vehicle lookup table.
     """
-    vehicle_lookup = []
-    for combination in itertools.product(
-        people_in_house,
-        postcodes,
-        disconnect_gas,
-        vehicle_types,
-        vehicle_sizes,
-        km_per_week,
-    ):
-        (
-            people,
-            postcode,
-            disconnect,
-            vehicle_type,
-            vehicle_size,
-            kilometers,
-        ) = combination
-
-        your_home = YourHomeAnswers(
-            people_in_house=people,
-            postcode=postcode,
-            disconnect_gas=disconnect,
-        )
-        driving = DrivingAnswers(
+    driving_answers = [
+        DrivingAnswers(
             vehicle_type=vehicle_type,
             vehicle_size=vehicle_size,
             km_per_week=kilometers,
         )
-        cost_emissions, my_plan = calculate_cost_and_emissions(your_home, driving)
-        my_climate_zone = get_climate_zone_cached(postcode)
-
-        row = {
-            "climate_zone": my_climate_zone,
-            "electricity_plan_name": my_plan.electricity_plan.name,
-            "natural_gas_plan_name": my_plan.natural_gas_plan.name,
-            "lpg_plan_name": my_plan.lpg_plan.name,
-            "wood_price_name": my_plan.wood_price.name,
-            "petrol_price_name": my_plan.petrol_price.name,
-            "diesel_price_name": my_plan.diesel_price.name,
-            "people_in_house": people,
-            "disconnect_gas": disconnect,
-            "vehicle_type": vehicle_type,
-            "vehicle_size": vehicle_size,
-            "km_per_week": kilometers,
-            "annual_variable_cost": cost_emissions["variable_cost_nzd"],
-            "annual_kg_co2e": cost_emissions["emissions_kg_co2e"],
-        }
-        vehicle_lookup.append(row)
+        for vehicle_type, vehicle_size, kilometers in itertools.product(
+            vehicle_types, vehicle_sizes, km_per_week
+        )
+    ]
+    representative_postcodes = get_representative_postcodes()
+    for people in people_in_house:
+        for postcode, disconnect in itertools.product(
+            representative_postcodes, disconnect_gas
+        ):
+            your_home = YourHomeAnswers(
+                people_in_house=people,
+                postcode=postcode,
+                disconnect_gas=disconnect,
+            )
+            plan_columns = get_plan_columns_cached(postcode)
+            for driving in driving_answers:
+                cost_emissions = calculate_cost_and_emissions(your_home, driving)
+                yield (
+                    *plan_columns,
+                    people,
+                    disconnect,
+                    driving.vehicle_type,
+                    driving.vehicle_size,
+                    driving.km_per_week,
+                    cost_emissions["variable_cost_nzd"],
+                    cost_emissions["emissions_kg_co2e"],
+                )
+
+        logging.info("Generated vehicle rows for %s people.", people)
 
-        if len(vehicle_lookup) % REPORT_EVERY_N_ROWS == 0:
-            logging.info("Appended %s rows to vehicle_lookup.", len(vehicle_lookup))
 
-    vehicle_df = pd.DataFrame(vehicle_lookup)
-    return uniquify_rows_and_write_to_csv(
-        vehicle_df, os.path.join(LOOKUP_DIR, "vehicle_lookup_table.csv")
+def generate_vehicle_lookup_table():
+    """
+    Generate the vehicle lookup table.
+    """
+    return write_rows_to_csv(
+        vehicle_lookup_rows(),
+        VEHICLE_COLUMNS,
+        os.path.join(LOOKUP_DIR, "vehicle_lookup_table.csv"),
     )
 
 
@@ -399,15 +464,17 @@ def generate_natural_gas_fixed_cost_lookup_table():
     """
     Generate the natural gas fixed cost lookup table.
     """
-    natural_gas_fixed_cost_rows = []
+    unique_plans = {}
     for postcode in postcodes:
-        my_plan = get_energy_plan_cached(postcode, DEFAULT_VEHICLE_TYPE)
-        row = {
-            "natural_gas_plan_name": my_plan.natural_gas_plan.name,
-            "natural_gas_daily_charge": my_plan.natural_gas_plan.daily_charge,
-        }
-        natural_gas_fixed_cost_rows.append(row)
-    natural_gas_fixed_costs_df = pd.DataFrame(natural_gas_fixed_cost_rows)
+        plan = get_energy_plan_cached(postcode, DEFAULT_VEHICLE_TYPE).natural_gas_plan
+        unique_plans.setdefault(plan.name, plan)
+    natural_gas_fixed_cost_rows = [
+        (plan.name, plan.daily_charge) for plan in unique_plans.values()
+    ]
+    natural_gas_fixed_costs_df = pd.DataFrame(
+        natural_gas_fixed_cost_rows,
+        columns=["natural_gas_plan_name", "natural_gas_daily_charge"],
+    )
     return uniquify_rows_and_write_to_csv(
         natural_gas_fixed_costs_df,
         os.path.join(LOOKUP_DIR, "natural_gas_fixed_cost_lookup_table.csv"),
@@ -418,15 +485,17 @@ def generate_lpg_fixed_cost_lookup_table():
     """
     Generate the LPG fixed cost lookup table.
     """
-    lpg_fixed_cost_rows = []
+    unique_plans = {}
     for postcode in postcodes:
-        my_plan = get_energy_plan_cached(postcode, DEFAULT_VEHICLE_TYPE)
-        row = {
-            "lpg_plan_name": my_plan.lpg_plan.name,
-            "lpg_daily_charge": my_plan.lpg_plan.daily_charge,
-        }
-        lpg_fixed_cost_rows.append(row)
-    lpg_fixed_costs_df = pd.DataFrame(lpg_fixed_cost_rows)
+        plan = get_energy_plan_cached(postcode, DEFAULT_VEHICLE_TYPE).lpg_plan
+        unique_plans.setdefault(plan.name, plan)
+    lpg_fixed_cost_rows = [
+        (plan.name, plan.daily_charge) for plan in unique_plans.values()
+    ]
+    lpg_fixed_costs_df = pd.DataFrame(
+        lpg_fixed_cost_rows,
+        columns=["lpg_plan_name", "lpg_daily_charge"],
+    )
     return uniquify_rows_and_write_to_csv(
         lpg_fixed_costs_df,
         os.path.join(LOOKUP_DIR, "lpg_fixed_cost_lookup_table.csv"),
@@ -452,22 +521,50 @@ def generate_average_household_savings_lookup_table():
     )
 
 
-#### MAIN ####
-
-clear_output_dir(LOOKUP_DIR)
-logging.info("Generating postcode lookup table...")
-postcode_table = generate_postcode_lookup_table()
-logging.info("Generating heating lookup table...")
-heating_table = generate_heating_lookup_table()
-logging.info("Generating hot water lookup table...")
-hotwater_table = generate_hot_water_lookup_table()
-logging.info("Generating cooktop lookup table...")
-cooktop_table = generate_cooktop_lookup_table()
-logging.info("Generating vehicle lookup table...")
-vehicle_table = generate_vehicle_lookup_table()
-logging.info("Generating natural gas fixed cost lookup table...")
-natural_gas_fixed_cost_table = generate_natural_gas_fixed_cost_lookup_table()
-logging.info("Generating LPG fixed cost lookup table...")
-lpg_fixed_cost_table = generate_lpg_fixed_cost_lookup_table()
-logging.info("Generating average household savings lookup table...")
-average_household_savings_table = generate_average_household_savings_lookup_table()
+def generate_combination_lookup_table(table_name):
+    """
+    Generate one of the per-combination lookup tables by name.
+
+    This runs in a worker process and returns the number of rows written.
+    """
+    logging.info("Generating %s lookup table...", table_name)
+    return COMBINATION_LOOKUP_TABLE_GENERATORS[table_name]()
+
+
+COMBINATION_LOOKUP_TABLE_GENERATORS = {
+    "heating": generate_heating_lookup_table,
+    "hot water": generate_hot_water_lookup_table,
+    "cooktop": generate_cooktop_lookup_table,
+    "vehicle": generate_vehicle_lookup_table,
+}
+
+
+def main():
+    """
+    Generate all lookup tables.
+
+    The per-combination tables are independent of each other, so they
+    are generated in parallel worker processes.
+    """
+    clear_output_dir(LOOKUP_DIR)
+    logging.info("Generating postcode lookup table...")
+    generate_postcode_lookup_table()
+    with ProcessPoolExecutor(
+        max_workers=len(COMBINATION_LOOKUP_TABLE_GENERATORS)
+    ) as executor:
+        list(
+            executor.map(
+                generate_combination_lookup_table,
+                COMBINATION_LOOKUP_TABLE_GENERATORS,
+            )
+        )
+    logging.info("Generating natural gas fixed cost lookup table...")
+    generate_natural_gas_fixed_cost_lookup_table()
+    logging.info("Generating LPG fixed cost lookup table...")
+    generate_lpg_fixed_cost_lookup_table()
+    logging.info("Generating average household savings lookup table...")
+    generate_average_household_savings_lookup_table()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@
 Script to generate lookup table for the deviate PHP web app.
 """
 
-import itertools
 import logging
 import os
 
@@ -12,9 +11,10 @@ from app.constants import CHECKBOX_BEHAVIOUR
 
 logging.basicConfig(level=logging.INFO)
 
-# Constant for the lookup directory. Relative to the script location.
-LOOKUP_DIR = os.path.join(os.path.dirname(__file__), "..", "lookup")
-REPORT_EVERY_N_ROWS = 1e5
+# Constant for the lookup directory. Relative to the script location,
+# resolved once to an absolute path so it does not depend on the
+# working directory or carry a ".." component.
+LOOKUP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "lookup"))
 OUTPUT_FILE = "gas_connection_lookup_table.csv"
 
 # Ensure the directory exists
@@ -56,78 +56,80 @@ energy_plan_cache = {}
 climate_zone_cache = {}
 cost_emissions_cache = {}
 
-fixed_cost_lookup = []
-for combination in itertools.product(
-    main_heating_sources,
-    alternative_main_heating_sources,
-    hot_water_heating_sources,
-    alternative_hot_water_heating_sources,
-    cooktop_types,
-    alternative_cooktop_types,
-):
-    (
-        main_heating_source,
-        alternative_main_heating_source,
-        hot_water_heating_source,
-        alternative_hot_water_heating_source,
-        cooktop_type,
-        alternative_cooktop_type,
-    ) = combination
-
-    current_sources = [
-        main_heating_source,
-        hot_water_heating_source,
-        cooktop_type,
-    ]
-    alternative_sources = [
-        alternative_main_heating_source,
-        alternative_hot_water_heating_source,
-        alternative_cooktop_type,
-    ]
+CURRENT_SOURCE_COLUMNS = [
+    "main_heating_source",
+    "hot_water_heating_source",
+    "cooktop_type",
+]
+ALTERNATIVE_SOURCE_COLUMNS = [
+    "alternative_main_heating_source",
+    "alternative_hot_water_heating_source",
+    "alternative_cooktop_type",
+]
+GAS_USAGE_COLUMNS = [
+    "current_uses_piped_gas",
+    "current_uses_bottled_gas",
+    "alternative_uses_piped_gas",
+    "alternative_uses_bottled_gas",
+]
 
-    current_uses_piped_gas = any(
-        "piped gas" in source.lower() for source in current_sources if source
-    )
-    current_uses_bottled_gas = any(
-        "bottled gas" in source.lower() for source in current_sources if source
-    )
-    alternative_uses_piped_gas = any(
-        "piped gas" in source.lower() for source in alternative_sources if source
-    )
-    alternative_uses_bottled_gas = any(
-        "bottled gas" in source.lower() for source in alternative_sources if source
-    )
-
-    checkbox = CHECKBOX_BEHAVIOUR[
-        (
-            current_uses_piped_gas,
-            current_uses_bottled_gas,
-            alternative_uses_piped_gas,
-            alternative_uses_bottled_gas,
-        )
-    ]
 
-    row = {
-        "main_heating_source": main_heating_source,
-        "hot_water_heating_source": hot_water_heating_source,
-        "cooktop_type": cooktop_type,
-        "alternative_main_heating_source": alternative_main_heating_source,
-        "alternative_hot_water_heating_source": alternative_hot_water_heating_source,
-        "alternative_cooktop_type": alternative_cooktop_type,
-        "current_uses_piped_gas": current_uses_piped_gas,
-        "current_uses_bottled_gas": current_uses_bottled_gas,
-        "alternative_uses_piped_gas": alternative_uses_piped_gas,
-        "alternative_uses_bottled_gas": alternative_uses_bottled_gas,
-        "checkbox_text": checkbox["checkbox_text"],
-        "checkbox_visible": checkbox["checkbox_visible"],
-        "checkbox_greyed_out": checkbox["checkbox_greyed_out"],
-        "checkbox_default_on": checkbox["checkbox_default_on"],
-    }
-    fixed_cost_lookup.append(row)
-
-    if len(fixed_cost_lookup) % REPORT_EVERY_N_ROWS == 0:
-        logging.info("Appended %s rows to fixed_cost_lookup.", len(fixed_cost_lookup))
-
-fixed_cost_df = pd.DataFrame(fixed_cost_lookup)
+def uses_gas(sources, gas_type):
+    """
+    Flag the rows in which any of the given source columns uses the gas type.
+
+    Missing sources (None) never use gas.
+    """
+    return sources.apply(
+        lambda column: column.str.lower().str.contains(gas_type, na=False)
+    ).any(axis=1)
+
+
+# Build the cartesian product of all answer combinations in one step
+# rather than appending a dict per combination.
+fixed_cost_df = pd.MultiIndex.from_product(
+    [
+        main_heating_sources,
+        alternative_main_heating_sources,
+        hot_water_heating_sources,
+        alternative_hot_water_heating_sources,
+        cooktop_types,
+        alternative_cooktop_types,
+    ],
+    names=[
+        "main_heating_source",
+        "alternative_main_heating_source",
+        "hot_water_heating_source",
+        "alternative_hot_water_heating_source",
+        "cooktop_type",
+        "alternative_cooktop_type",
+    ],
+).to_frame(index=False)
+fixed_cost_df = fixed_cost_df[CURRENT_SOURCE_COLUMNS + ALTERNATIVE_SOURCE_COLUMNS]
+
+fixed_cost_df["current_uses_piped_gas"] = uses_gas(
+    fixed_cost_df[CURRENT_SOURCE_COLUMNS], "piped gas"
+)
+fixed_cost_df["current_uses_bottled_gas"] = uses_gas(
+    fixed_cost_df[CURRENT_SOURCE_COLUMNS], "bottled gas"
+)
+fixed_cost_df["alternative_uses_piped_gas"] = uses_gas(
+    fixed_cost_df[ALTERNATIVE_SOURCE_COLUMNS], "piped gas"
+)
+fixed_cost_df["alternative_uses_bottled_gas"] = uses_gas(
+    fixed_cost_df[ALTERNATIVE_SOURCE_COLUMNS], "bottled gas"
+)
+
+checkbox_df = pd.DataFrame.from_dict(CHECKBOX_BEHAVIOUR, orient="index")[
+    [
+        "checkbox_text",
+        "checkbox_visible",
+        "checkbox_greyed_out",
+        "checkbox_default_on",
+    ]
+]
+checkbox_df.index.names = GAS_USAGE_COLUMNS
+fixed_cost_df = fixed_cost_df.join(checkbox_df, on=GAS_USAGE_COLUMNS)
+logging.info("Generated %s rows for fixed_cost_lookup.", len(fixed_cost_df))
 
 fixed_cost_df.to_csv(os.path.join(LOOKUP_DIR, OUTPUT_FILE), index=False)
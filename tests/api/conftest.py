@@ -0,0 +1,20 @@
+"""
+Shared fixtures for the API tests.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    A single test client shared by all API test modules.
+
+    The client is entered as a context manager so that the application
+    lifespan starts up once for the session rather than per request.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
@@ -2,234 +2,183 @@
 Tests for the API
 """
 
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-client = TestClient(app)
-
-
-def test_heating_savings_specific_alternative():
-    """
-    Test the /heating/savings endpoint with specific
-    alternative heating source provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "9810",
-            "disconnect_gas": True,
-        },
-        "heating_answers": {
-            "main_heating_source": "Piped gas heater",
-            "alternative_main_heating_source": "Heat pump",
-            "heating_during_day": "Never",
-            "insulation_quality": "Not well insulated",
-        },
-    }
-
-    response = client.post("/heating/savings", json=profile_data)
-    assert response.status_code == 200
-    response_data = response.json()
-    assert len(response_data["alternatives"]) == 1
-    assert "Heat pump" in response_data["alternatives"]
-    assert isinstance(response_data["alternatives"], dict)
-
-
-def test_heating_savings_all_alternatives():
-    """
-    Test the /heating/savings endpoint without specific
-    alternative heating source provided.
-    """
-    profile_data = {
+import pytest
+
+USER_GEOGRAPHY = {
+    "9810": {
+        "edb_region": "Electricity Invercargill Ltd",
+        "climate_zone": "Invercargill",
+    },
+    "8022": {
+        "edb_region": "Orion New Zealand Ltd",
+        "climate_zone": "Christchurch",
+    },
+    "6012": {
+        "edb_region": "Wellington Electricity",
+        "climate_zone": "Wellington",
+    },
+    "1024": {
+        "edb_region": "Vector",
+        "climate_zone": "Auckland",
+    },
+}
+
+
+def savings_request(postcode, answers):
+    """
+    Build a savings request for a one-person household in the given
+    postcode that is disconnecting from gas.
+    """
+    return {
         "your_home": {
             "people_in_house": 1,
-            "postcode": "9810",
+            "postcode": postcode,
             "disconnect_gas": True,
         },
-        "heating_answers": {
-            "main_heating_source": "Piped gas heater",
-            "heating_during_day": "Never",
-            "insulation_quality": "Not well insulated",
-        },
+        **answers,
     }
 
-    response = client.post("/heating/savings", json=profile_data)
-    assert response.status_code == 200
-    response_data = response.json()
-
-    assert "Piped gas heater" in response_data["alternatives"]
-    assert "Bottled gas heater" in response_data["alternatives"]
-    assert "Heat pump" in response_data["alternatives"]
-    assert "Electric heater" in response_data["alternatives"]
-    assert "Wood burner" in response_data["alternatives"]
-
-
-def test_hot_water_savings_specific_alternative():
-    """
-    Test the /hot_water/savings endpoint with a specific
-    alternative hot water source provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "8022",
-            "disconnect_gas": True,
-        },
-        "hot_water_answers": {
-            "hot_water_usage": "Low",
-            "hot_water_heating_source": "Electric hot water cylinder",
-            "alternative_hot_water_heating_source": "Hot water heat pump",
-        },
-    }
 
-    response = client.post("/hot_water/savings", json=profile_data)
+@pytest.mark.parametrize(
+    "endpoint, postcode, answers, alternative",
+    [
+        (
+            "/heating/savings",
+            "9810",
+            {
+                "heating_answers": {
+                    "main_heating_source": "Piped gas heater",
+                    "alternative_main_heating_source": "Heat pump",
+                    "heating_during_day": "Never",
+                    "insulation_quality": "Not well insulated",
+                }
+            },
+            "Heat pump",
+        ),
+        (
+            "/hot_water/savings",
+            "8022",
+            {
+                "hot_water_answers": {
+                    "hot_water_usage": "Low",
+                    "hot_water_heating_source": "Electric hot water cylinder",
+                    "alternative_hot_water_heating_source": "Hot water heat pump",
+                }
+            },
+            "Hot water heat pump",
+        ),
+        (
+            "/cooktop/savings",
+            "6012",
+            {
+                "cooktop_answers": {
+                    "cooktop": "Piped gas",
+                    "alternative_cooktop": "Electric induction",
+                }
+            },
+            "Electric induction",
+        ),
+        (
+            "/driving/savings",
+            "1024",
+            {
+                "driving_answers": {
+                    "vehicle_type": "Petrol",
+                    "alternative_vehicle_type": "Electric",
+                    "vehicle_size": "Small",
+                    "km_per_week": "50 or less",
+                }
+            },
+            "Electric",
+        ),
+    ],
+    ids=["heating", "hot_water", "cooktop", "driving"],
+)
+def test_savings_specific_alternative(client, endpoint, postcode, answers, alternative):
+    """
+    Test each component savings endpoint with a specific
+    alternative provided.
+    """
+    response = client.post(endpoint, json=savings_request(postcode, answers))
     assert response.status_code == 200
     response_data = response.json()
 
     assert len(response_data["alternatives"]) == 1
-    assert "Hot water heat pump" in response_data["alternatives"]
-    assert response_data["user_geography"]["edb_region"] == "Orion New Zealand Ltd"
-    assert response_data["user_geography"]["climate_zone"] == "Christchurch"
-
-
-def test_hot_water_savings_without_alternative():
-    """
-    Test the /hot_water/savings endpoint without a specific
-    alternative hot water source provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "8022",
-            "disconnect_gas": True,
-        },
-        "hot_water_answers": {
-            "hot_water_usage": "Low",
-            "hot_water_heating_source": "Electric hot water cylinder",
-        },
-    }
-
-    response = client.post("/hot_water/savings", json=profile_data)
-    assert response.status_code == 200
-    response_data = response.json()
-
-    assert "Hot water heat pump" in response_data["alternatives"]
-    assert response_data["user_geography"]["edb_region"] == "Orion New Zealand Ltd"
-    assert response_data["user_geography"]["climate_zone"] == "Christchurch"
-
-
-def test_cooktop_savings_specific_alternative():
-    """
-    Test the /cooktop/savings endpoint with a specific
-    alternative cooktop provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "6012",
-            "disconnect_gas": True,
-        },
-        "cooktop_answers": {
-            "cooktop": "Piped gas",
-            "alternative_cooktop": "Electric induction",
-        },
-    }
-
-    response = client.post("/cooktop/savings", json=profile_data)
-    assert response.status_code == 200
-    response_data = response.json()
-
-    assert len(response_data["alternatives"]) == 1
-    assert "Electric induction" in response_data["alternatives"]
-    assert response_data["user_geography"]["edb_region"] == "Wellington Electricity"
-    assert response_data["user_geography"]["climate_zone"] == "Wellington"
-    assert isinstance(response_data["alternatives"], dict)
-
-
-def test_cooktop_savings_all_alternatives():
-    """
-    Test the /cooktop/savings endpoint without a specific
-    alternative cooktop provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "6012",
-            "disconnect_gas": True,
-        },
-        "cooktop_answers": {
-            "cooktop": "Piped gas",
-        },
-    }
-
-    response = client.post("/cooktop/savings", json=profile_data)
-    assert response.status_code == 200
-    response_data = response.json()
-
-    assert "Electric induction" in response_data["alternatives"]
-    assert "Piped gas" in response_data["alternatives"]
-    assert "Bottled gas" in response_data["alternatives"]
-    assert "Electric (coil or ceramic)" in response_data["alternatives"]
-    assert response_data["user_geography"]["edb_region"] == "Wellington Electricity"
-    assert response_data["user_geography"]["climate_zone"] == "Wellington"
-
-
-def test_driving_savings_specific_alternative():
-    """
-    Test the /driving/savings endpoint with a specific
-    alternative vehicle type provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "1024",
-            "disconnect_gas": True,
-        },
-        "driving_answers": {
-            "vehicle_type": "Petrol",
-            "alternative_vehicle_type": "Electric",
-            "vehicle_size": "Small",
-            "km_per_week": "50 or less",
-        },
-    }
-
-    response = client.post("/driving/savings", json=profile_data)
-    assert response.status_code == 200
-    response_data = response.json()
-
-    assert len(response_data["alternatives"]) == 1
-    assert "Electric" in response_data["alternatives"]
-    assert response_data["user_geography"]["edb_region"] == "Vector"
-    assert response_data["user_geography"]["climate_zone"] == "Auckland"
-
-
-def test_driving_savings_all_alternatives():
-    """
-    Test the /driving/savings endpoint without a specific
-    alternative vehicle type provided.
-    """
-    profile_data = {
-        "your_home": {
-            "people_in_house": 1,
-            "postcode": "1024",
-            "disconnect_gas": True,
-        },
-        "driving_answers": {
-            "vehicle_type": "Petrol",
-            "vehicle_size": "Small",
-            "km_per_week": "50 or less",
-        },
-    }
-
-    response = client.post("/driving/savings", json=profile_data)
+    assert alternative in response_data["alternatives"]
+    assert response_data["user_geography"] == USER_GEOGRAPHY[postcode]
+
+
+@pytest.mark.parametrize(
+    "endpoint, postcode, answers, alternatives",
+    [
+        (
+            "/heating/savings",
+            "9810",
+            {
+                "heating_answers": {
+                    "main_heating_source": "Piped gas heater",
+                    "heating_during_day": "Never",
+                    "insulation_quality": "Not well insulated",
+                }
+            },
+            [
+                "Piped gas heater",
+                "Bottled gas heater",
+                "Heat pump",
+                "Electric heater",
+                "Wood burner",
+            ],
+        ),
+        (
+            "/hot_water/savings",
+            "8022",
+            {
+                "hot_water_answers": {
+                    "hot_water_usage": "Low",
+                    "hot_water_heating_source": "Electric hot water cylinder",
+                }
+            },
+            ["Hot water heat pump"],
+        ),
+        (
+            "/cooktop/savings",
+            "6012",
+            {
+                "cooktop_answers": {
+                    "cooktop": "Piped gas",
+                }
+            },
+            [
+                "Electric induction",
+                "Piped gas",
+                "Bottled gas",
+                "Electric (coil or ceramic)",
+            ],
+        ),
+        (
+            "/driving/savings",
+            "1024",
+            {
+                "driving_answers": {
+                    "vehicle_type": "Petrol",
+                    "vehicle_size": "Small",
+                    "km_per_week": "50 or less",
+                }
+            },
+            ["Petrol", "Diesel", "Hybrid", "Plug-in hybrid", "Electric"],
+        ),
+    ],
+    ids=["heating", "hot_water", "cooktop", "driving"],
+)
+def test_savings_all_alternatives(client, endpoint, postcode, answers, alternatives):
+    """
+    Test each component savings endpoint without a specific
+    alternative provided.
+    """
+    response = client.post(endpoint, json=savings_request(postcode, answers))
     assert response.status_code == 200
     response_data = response.json()
 
-    assert "Petrol" in response_data["alternatives"]
-    assert "Diesel" in response_data["alternatives"]
-    assert "Hybrid" in response_data["alternatives"]
-    assert "Plug-in hybrid" in response_data["alternatives"]
-    assert "Electric" in response_data["alternatives"]
-    assert response_data["user_geography"]["edb_region"] == "Vector"
-    assert response_data["user_geography"]["climate_zone"] == "Auckland"
+    for alternative in alternatives:
+        assert alternative in response_data["alternatives"]
+    assert response_data["user_geography"] == USER_GEOGRAPHY[postcode]
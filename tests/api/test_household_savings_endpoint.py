@@ -2,17 +2,12 @@
 Tests for the API
 """
 
-from fastapi.testclient import TestClient
-
 import app.services.configuration as cfg
 from app.api.household_savings_endpoint import household_energy_profile
-from app.main import app
 from app.models.user_answers import HouseholdAnswers
 
-client = TestClient(app)
-
 
-def test_read_root():
+def test_read_root(client):
     """
     Test the root endpoint to ensure it returns the correct response.
     """
@@ -21,7 +16,7 @@ def test_read_root():
     assert "<html>" in response.text
 
 
-def test_household_energy_profile():
+def test_household_energy_profile(client):
     """
     Test the /household-energy-profile/ endpoint with valid input data.
     """
@@ -78,7 +73,7 @@ def test_household_energy_profile():
     assert isinstance(response_data["gas_connection_savings"], dict)
 
 
-def test_complete_household_energy_profile():
+def test_complete_household_energy_profile(client):
     """
     Test the /household-energy-profile/ endpoint with
     complete details and alternatives provided.
@@ -128,7 +123,7 @@ def test_complete_household_energy_profile():
     assert response_data["user_geography"]["climate_zone"] == "Rotorua"
 
 
-def test_partial_household_energy_profile():
+def test_partial_household_energy_profile(client):
     """
     Test the /household-energy-profile/ endpoint with
     some components missing alternative details.
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the model tests.
+"""
+
+import pytest
+
+from app.models.energy_plans import HouseholdEnergyPlan
+from app.services.configuration import (
+    get_default_annual_other_vehicle_costs,
+    get_default_diesel_price,
+    get_default_driving_answers,
+    get_default_electricity_plan,
+    get_default_lpg_plan,
+    get_default_natural_gas_plan,
+    get_default_petrol_price,
+    get_default_public_ev_charger_rate,
+    get_default_wood_price,
+)
+from app.services.get_energy_plans import get_energy_plan, postcode_to_electricity_plan
+
+
+@pytest.fixture(scope="session")
+def my_energy_plan():
+    """
+    The household energy plan for postcode 6012, built once per session.
+    """
+    return get_energy_plan("6012", "None")
+
+
+@pytest.fixture(scope="session")
+def my_electricity_plan():
+    """
+    The electricity plan for postcode 6012, looked up once per session.
+    """
+    return postcode_to_electricity_plan("6012")
+
+
+@pytest.fixture(scope="session")
+def default_plan():
+    """
+    The default household energy plan, priced for the default vehicle.
+    """
+    return HouseholdEnergyPlan(
+        name="Basic Household Energy Plan",
+        electricity_plan=get_default_electricity_plan(),
+        natural_gas_plan=get_default_natural_gas_plan(),
+        lpg_plan=get_default_lpg_plan(),
+        wood_price=get_default_wood_price(),
+        petrol_price=get_default_petrol_price(),
+        diesel_price=get_default_diesel_price(),
+        public_charging_price=get_default_public_ev_charger_rate(),
+        other_vehicle_costs=get_default_annual_other_vehicle_costs(
+            get_default_driving_answers().vehicle_type
+        ),
+    )
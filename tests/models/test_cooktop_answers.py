@@ -2,6 +2,10 @@
 Test energy consumption profile and behaviour of the CooktopAnswers class.
 """
 
+from operator import attrgetter
+from types import MappingProxyType
+
+import pytest
 from pytest import approx, raises
 
 from app.constants import DAYS_IN_YEAR
@@ -11,9 +15,6 @@ from app.services.configuration import (
     get_default_your_home_answers,
 )
 from app.services.cost_calculator import calculate_savings_for_option
-from app.services.get_energy_plans import get_energy_plan
-
-MY_ENERGY_PLAN = get_energy_plan("6012", "None")
 
 YOUR_HOME = YourHomeAnswers(
     people_in_house=4,
@@ -27,6 +28,90 @@ COOKTOP = CooktopAnswers(
 )
 
 
+# Modeled energy use in kWh for each cooktop type. This is based
+# on a linearized energy use model that preserves the average
+# household energy use for cooking, by the linearity of expectation.
+# (See 'Cooking' sheet of supporting workbook.)
+EXPECTED_ENERGY_USE = MappingProxyType(
+    {
+        "Electric induction": (159, 239, 319, 398, 478, 558),
+        "Piped gas": (412, 618, 824, 1030, 1236, 1442),
+        "Bottled gas": (412, 618, 824, 1030, 1236, 1442),
+        "Electric (coil or ceramic)": (176, 264, 352, 440, 528, 617),
+    }
+)
+
+# The usage profile field that carries each cooktop type's energy use
+ENERGY_USE_FIELD = {
+    "Electric induction": "inflexible_day_kwh",
+    "Electric (coil or ceramic)": "inflexible_day_kwh",
+    "Piped gas": "natural_gas_kwh",
+    "Bottled gas": "lpg_kwh",
+}
+
+COOKING_ENERGY_USE_CASES = [
+    (cooktop_type, people_in_house, expected_kwh)
+    for cooktop_type, energy_use_values in EXPECTED_ENERGY_USE.items()
+    for people_in_house, expected_kwh in enumerate(energy_use_values, start=1)
+]
+
+# Expected field values based on cooktop type
+EXPECTED_VALUES = MappingProxyType(
+    {
+        "Electric induction": MappingProxyType(
+            {
+                "elx_connection_days": DAYS_IN_YEAR,
+                "flexible_kwh": 0,
+                "natural_gas_kwh": 0,
+                "lpg_kwh": 0,
+                "natural_gas_connection_days": 0,
+                "lpg_tanks_rental_days": 0,
+            }
+        ),
+        "Piped gas": MappingProxyType(
+            {
+                "elx_connection_days": 0,
+                "inflexible_day_kwh": 0,
+                "flexible_kwh": 0,
+                "lpg_kwh": 0,
+                "natural_gas_connection_days": DAYS_IN_YEAR,
+                "lpg_tanks_rental_days": 0,
+            }
+        ),
+        "Bottled gas": MappingProxyType(
+            {
+                "elx_connection_days": 0,
+                "inflexible_day_kwh": 0,
+                "flexible_kwh": 0,
+                "natural_gas_connection_days": 0,
+                "lpg_tanks_rental_days": DAYS_IN_YEAR,
+            }
+        ),
+        "Electric (coil or ceramic)": MappingProxyType(
+            {
+                "elx_connection_days": DAYS_IN_YEAR,
+                "flexible_kwh": 0,
+                "natural_gas_kwh": 0,
+                "lpg_kwh": 0,
+                "natural_gas_connection_days": 0,
+                "lpg_tanks_rental_days": 0,
+            }
+        ),
+    }
+)
+
+# One getter and one expected tuple per cooktop type, so that each case
+# checks all of its fields in a single comparison.
+EXPECTED_FIELD_GETTERS = {
+    cooktop_type: attrgetter(*fields)
+    for cooktop_type, fields in EXPECTED_VALUES.items()
+}
+EXPECTED_FIELD_VALUES = {
+    cooktop_type: tuple(fields.values())
+    for cooktop_type, fields in EXPECTED_VALUES.items()
+}
+
+
 def test_invalid_cooktop_type():
     """
     Test that an invalid cooktop type raises a ValueError.
@@ -46,102 +131,47 @@ def test_invalid_cooktop_type():
         cooktop_answers.energy_usage_pattern(your_home)
 
 
-def test_cooking_energy_usage():
+@pytest.mark.parametrize(
+    "cooktop_type, people_in_house, expected_kwh", COOKING_ENERGY_USE_CASES
+)
+def test_cooking_energy_usage(cooktop_type, people_in_house, expected_kwh):
     """
     Test the energy usage pattern for cooking.
     """
-    your_home = get_default_your_home_answers()
-    cooktop = get_default_cooktop_answers()
-
-    # Modeled energy use in kWh for each cooktop type. This is based
-    # on a linearized energy use model that preserves the average
-    # household energy use for cooking, by the linearity of expectation.
-    # (See 'Cooking' sheet of supporting workbook.)
-    expected_energy_use = {
-        "Electric induction": [159, 239, 319, 398, 478, 558],
-        "Piped gas": [412, 618, 824, 1030, 1236, 1442],
-        "Bottled gas": [412, 618, 824, 1030, 1236, 1442],
-        "Electric (coil or ceramic)": [176, 264, 352, 440, 528, 617],
-    }
+    your_home = get_default_your_home_answers().model_copy(
+        update={"people_in_house": people_in_house}
+    )
+    cooktop = get_default_cooktop_answers().model_copy(update={"cooktop": cooktop_type})
+    cooktop_energy_use = cooktop.energy_usage_pattern(your_home)
 
-    # Expected field values based on cooktop type
-    expected_values = {
-        "Electric induction": {
-            "elx_connection_days": DAYS_IN_YEAR,
-            "flexible_kwh": 0,
-            "natural_gas_kwh": 0,
-            "lpg_kwh": 0,
-            "natural_gas_connection_days": 0,
-            "lpg_tanks_rental_days": 0,
-        },
-        "Piped gas": {
-            "elx_connection_days": 0,
-            "inflexible_day_kwh": 0,
-            "flexible_kwh": 0,
-            "lpg_kwh": 0,
-            "natural_gas_connection_days": DAYS_IN_YEAR,
-            "lpg_tanks_rental_days": 0,
-        },
-        "Bottled gas": {
-            "elx_connection_days": 0,
-            "inflexible_day_kwh": 0,
-            "flexible_kwh": 0,
-            "natural_gas_connection_days": 0,
-            "lpg_tanks_rental_days": DAYS_IN_YEAR,
-        },
-        "Electric (coil or ceramic)": {
-            "elx_connection_days": DAYS_IN_YEAR,
-            "flexible_kwh": 0,
-            "natural_gas_kwh": 0,
-            "lpg_kwh": 0,
-            "natural_gas_connection_days": 0,
-            "lpg_tanks_rental_days": 0,
-        },
-    }
+    # Expected energy usage (day_kwh, lpg_kwh or natural_gas_kwh)
+    assert getattr(cooktop_energy_use, ENERGY_USE_FIELD[cooktop_type]) == approx(
+        expected_kwh, rel=1e-2
+    )
 
-    for cooktop_type, energy_use_values in expected_energy_use.items():
-        cooktop.cooktop = cooktop_type
-        for i, expected_kwh in enumerate(energy_use_values):
-            your_home.people_in_house = i + 1
-            cooktop_energy_use = cooktop.energy_usage_pattern(your_home)
-
-            # Assertions for expected energy usage (day_kwh, lpg_kwh, natural_gas_kwh)
-            if cooktop_type in ["Electric induction", "Electric (coil or ceramic)"]:
-                assert cooktop_energy_use.inflexible_day_kwh == approx(
-                    expected_kwh, rel=1e-2
-                )
-            elif cooktop_type == "Piped gas":
-                assert cooktop_energy_use.natural_gas_kwh == approx(
-                    expected_kwh, rel=1e-2
-                )
-            elif cooktop_type == "Bottled gas":
-                assert cooktop_energy_use.lpg_kwh == approx(expected_kwh, rel=1e-2)
-
-            # General assertions based on the cooktop type
-            for field, expected_value in expected_values[cooktop_type].items():
-                assert (
-                    getattr(cooktop_energy_use, field) == expected_value
-                ), f"{field} failed for {cooktop_type}"
-
-
-def manual_cost_calculation_natural_gas():
+    # General assertions based on the cooktop type
+    assert (
+        EXPECTED_FIELD_GETTERS[cooktop_type](cooktop_energy_use)
+        == EXPECTED_FIELD_VALUES[cooktop_type]
+    ), f"Field values failed for {cooktop_type}"
+
+
+def manual_cost_calculation_natural_gas(energy_plan):
     """
     A manual calculation of the annual running
     cost for a natural gas cooktop
     """
-    energy_plan = get_energy_plan("6012", "None")
     natural_gas_kwh = COOKTOP.energy_usage_pattern(YOUR_HOME).natural_gas_kwh
     natural_gas_cost_per_kwh = energy_plan.natural_gas_plan.nzd_per_kwh["Uncontrolled"]
     annual_running_cost = natural_gas_kwh * natural_gas_cost_per_kwh
     return annual_running_cost
 
 
-def manual_cost_calculation_electric_induction():
+def manual_cost_calculation_electric_induction(energy_plan):
     """
     A manual calculation of the annual running
     cost for an electric induction cooktop
     """
-    energy_plan = get_energy_plan("6012", "None")
     inflexible_day_kwh = COOKTOP.energy_usage_pattern(
         YOUR_HOME, use_alternative=True
     ).inflexible_day_kwh
@@ -150,15 +180,15 @@ def manual_cost_calculation_electric_induction():
     return annual_running_cost
 
 
-def test_cost_savings_calculations():
+def test_cost_savings_calculations(my_energy_plan):
     """
     Test the savings calculations for a small petrol car
     and a small electric car, comparing with a manual calculation.
     """
-    gas_energy_costs = MY_ENERGY_PLAN.calculate_cost(
+    gas_energy_costs = my_energy_plan.calculate_cost(
         COOKTOP.energy_usage_pattern(YOUR_HOME)
     )
-    induction_energy_costs = MY_ENERGY_PLAN.calculate_cost(
+    induction_energy_costs = my_energy_plan.calculate_cost(
         COOKTOP.energy_usage_pattern(YOUR_HOME, use_alternative=True)
     )
     calculated_savings = calculate_savings_for_option(
@@ -167,10 +197,12 @@ def test_cost_savings_calculations():
     assert gas_energy_costs[1] == approx(
         calculated_savings["variable_cost_nzd"]["current"]
     )
-    assert gas_energy_costs[1] == approx(manual_cost_calculation_natural_gas())
+    assert gas_energy_costs[1] == approx(
+        manual_cost_calculation_natural_gas(my_energy_plan)
+    )
     assert induction_energy_costs[1] == approx(
         calculated_savings["variable_cost_nzd"]["alternative"]
     )
     assert induction_energy_costs[1] == approx(
-        manual_cost_calculation_electric_induction()
+        manual_cost_calculation_electric_induction(my_energy_plan)
     )
@@ -15,9 +15,6 @@ from app.models.energy_plans import HouseholdEnergyPlan
 from app.models.usage_profiles import YearlyFuelUsageProfile
 from app.models.user_answers import DrivingAnswers, YourHomeAnswers
 from app.services.cost_calculator import calculate_savings_for_option
-from app.services.get_energy_plans import postcode_to_electricity_plan
-
-MY_ELECTRICITY_PLAN = postcode_to_electricity_plan("6012")
 
 YOUR_HOME = YourHomeAnswers(
     people_in_house=4,
@@ -31,6 +28,12 @@ DRIVING = DrivingAnswers(
     vehicle_type="Petrol",
 )
 
+ANNUAL_DISTANCE_KM = float(DRIVING.km_per_week) / 7 * DAYS_IN_YEAR
+THOUSAND_KM = ANNUAL_DISTANCE_KM / 1000
+PETROL_LITRES = (
+    ANNUAL_DISTANCE_KM / 100 * FUEL_CONSUMPTION_LITRES_PER_100KM["Petrol"]["Small"]
+)
+
 
 def test_small_electric_car():
     """
@@ -57,14 +60,11 @@ def manual_calculation_petrol():
     licensing = 107.09
     ruc = 0
     scheduled_servicing = 1133.15
-    fuel_consumption_l_per_100km = FUEL_CONSUMPTION_LITRES_PER_100KM["Petrol"]["Small"]
     nzd_per_petrol_litre = 2.78
-    annual_distance_km = float(DRIVING.km_per_week) / 7 * DAYS_IN_YEAR
-    annual_fuel_consumption_l = annual_distance_km / 100 * fuel_consumption_l_per_100km
     annual_running_cost = (
-        annual_fuel_consumption_l * nzd_per_petrol_litre
+        PETROL_LITRES * nzd_per_petrol_litre
         + licensing
-        + ruc * annual_distance_km / 1000
+        + ruc * THOUSAND_KM
         + scheduled_servicing
     )
     return annual_running_cost
@@ -81,9 +81,8 @@ def manual_calculation_ev(home_elx_cost_per_kwh):
     battery_economy_kwh_per_100km = BATTERY_ECONOMY_KWH_PER_100KM["Electric"]["Small"]
     ev_public_charging_fraction = 0.2
     public_elx_cost_per_kwh = 0.80
-    annual_distance_km = float(DRIVING.km_per_week) / 7 * DAYS_IN_YEAR
     annual_elx_consumption_kwh = (
-        annual_distance_km / 100 * battery_economy_kwh_per_100km
+        ANNUAL_DISTANCE_KM / 100 * battery_economy_kwh_per_100km
     )
     public_elx_consumption_kwh = (
         annual_elx_consumption_kwh * ev_public_charging_fraction
@@ -95,20 +94,20 @@ def manual_calculation_ev(home_elx_cost_per_kwh):
         annual_public_elx_cost
         + annual_home_elx_cost
         + licensing
-        + ruc * annual_distance_km / 1000
+        + ruc * THOUSAND_KM
         + scheduled_servicing
     )
     return annual_running_cost
 
 
-def test_savings_calculations():
+def test_savings_calculations(my_electricity_plan):
     """
     Test the savings calculations for a small petrol car
     and a small electric car, comparing with a manual calculation.
     """
     petrol_plan = HouseholdEnergyPlan(
         name="Basic Household Energy Plan",
-        electricity_plan=MY_ELECTRICITY_PLAN,
+        electricity_plan=my_electricity_plan,
         natural_gas_plan=cfg.get_default_natural_gas_plan(),
         lpg_plan=cfg.get_default_lpg_plan(),
         wood_price=cfg.get_default_wood_price(),
@@ -118,26 +117,14 @@ def test_savings_calculations():
         other_vehicle_costs=cfg.get_default_annual_other_vehicle_costs("Petrol"),
     )
 
-    electric_plan = HouseholdEnergyPlan(
-        name="Basic Household Energy Plan",
-        electricity_plan=MY_ELECTRICITY_PLAN,
-        natural_gas_plan=cfg.get_default_natural_gas_plan(),
-        lpg_plan=cfg.get_default_lpg_plan(),
-        wood_price=cfg.get_default_wood_price(),
-        petrol_price=cfg.get_default_petrol_price(),
-        diesel_price=cfg.get_default_diesel_price(),
-        public_charging_price=cfg.get_default_public_ev_charger_rate(),
-        other_vehicle_costs=cfg.get_default_annual_other_vehicle_costs("Electric"),
+    electric_plan = petrol_plan.model_copy(
+        update={
+            "other_vehicle_costs": cfg.get_default_annual_other_vehicle_costs(
+                "Electric"
+            )
+        }
     )
 
-    thousand_km = float(DRIVING.km_per_week) / 7 * DAYS_IN_YEAR / 1000
-    petrol_litres = (
-        float(DRIVING.km_per_week)
-        / 7
-        * DAYS_IN_YEAR
-        / 100
-        * FUEL_CONSUMPTION_LITRES_PER_100KM["Petrol"]["Small"]
-    )
     petrol_energy_costs = petrol_plan.calculate_cost(
         YearlyFuelUsageProfile(
             elx_connection_days=365.25,
@@ -148,18 +135,14 @@ def test_savings_calculations():
             lpg_tanks_rental_days=0,
             lpg_kwh=0,
             wood_kwh=0,
-            petrol_litres=petrol_litres,
+            petrol_litres=PETROL_LITRES,
             diesel_litres=0,
             public_ev_charger_kwh=0,
-            thousand_km=thousand_km,
+            thousand_km=THOUSAND_KM,
         )
     )
     total_kwh = (
-        float(DRIVING.km_per_week)
-        / 7
-        * DAYS_IN_YEAR
-        / 100
-        * BATTERY_ECONOMY_KWH_PER_100KM["Electric"]["Small"]
+        ANNUAL_DISTANCE_KM / 100 * BATTERY_ECONOMY_KWH_PER_100KM["Electric"]["Small"]
     )
     public_ev_charger_kwh = total_kwh * EV_PUBLIC_CHARGING_FRACTION
     flexible_kwh = total_kwh - public_ev_charger_kwh
@@ -176,7 +159,7 @@ def test_savings_calculations():
             petrol_litres=0,
             diesel_litres=0,
             public_ev_charger_kwh=public_ev_charger_kwh,
-            thousand_km=thousand_km,
+            thousand_km=THOUSAND_KM,
         )
     )
     calculated_savings = calculate_savings_for_option(
@@ -91,14 +91,14 @@ def test_get_energy_plan():
     assert plan.diesel_price.per_diesel_litre == 2.16
 
 
-# pylint: disable=too-many-instance-attributes
 class TestElectricityPlan(unittest.TestCase):
     """
     Test the ElectricityPlan class.
     """
 
-    def setUp(self):
-        self.profile = HouseholdYearlyFuelUsageProfile(
+    @classmethod
+    def setUpClass(cls):
+        cls.profile = HouseholdYearlyFuelUsageProfile(
             elx_connection_days=DAYS_IN_YEAR,
             inflexible_day_kwh=300,
             flexible_kwh=100,
@@ -117,55 +117,55 @@ class TestElectricityPlan(unittest.TestCase):
             thousand_km_electric=0,
         )
 
-        self.day = 0.25
-        self.night = 0.15
-        self.controlled = 0.20
-        self.uncontrolled = 0.22
-        self.all_inclusive = 0.18
-        self.high_daily_charge = 1.5
-        self.daily_charge = 1.0
+        cls.day = 0.25
+        cls.night = 0.15
+        cls.controlled = 0.20
+        cls.uncontrolled = 0.22
+        cls.all_inclusive = 0.18
+        cls.high_daily_charge = 1.5
+        cls.daily_charge = 1.0
 
-        self.electricity_plan = ElectricityPlan(
+        cls.electricity_plan = ElectricityPlan(
             name="TestPlan",
-            daily_charge=self.high_daily_charge,
+            daily_charge=cls.high_daily_charge,
             nzd_per_kwh={
-                "Day": self.day,
-                "Night": self.night,
-                "Controlled": self.controlled,
+                "Day": cls.day,
+                "Night": cls.night,
+                "Controlled": cls.controlled,
             },
         )
-        self.electricity_plan_all_inclusive = ElectricityPlan(
+        cls.electricity_plan_all_inclusive = ElectricityPlan(
             name="AllInclusivePlan",
-            daily_charge=self.daily_charge,
-            nzd_per_kwh={"All inclusive": self.all_inclusive},
+            daily_charge=cls.daily_charge,
+            nzd_per_kwh={"All inclusive": cls.all_inclusive},
         )
-        self.electricity_plan_day_night = ElectricityPlan(
+        cls.electricity_plan_day_night = ElectricityPlan(
             name="AllInclusivePlan",
-            daily_charge=self.daily_charge,
-            nzd_per_kwh={"Day": self.day, "Night": self.night},
+            daily_charge=cls.daily_charge,
+            nzd_per_kwh={"Day": cls.day, "Night": cls.night},
         )
-        self.electricity_plan_uncontrolled = ElectricityPlan(
+        cls.electricity_plan_uncontrolled = ElectricityPlan(
             name="UncontrolledPlan",
-            daily_charge=self.daily_charge,
-            nzd_per_kwh={"Uncontrolled": self.uncontrolled},
+            daily_charge=cls.daily_charge,
+            nzd_per_kwh={"Uncontrolled": cls.uncontrolled},
         )
-        self.electricity_plan_uncontrolled_controlled = ElectricityPlan(
+        cls.electricity_plan_uncontrolled_controlled = ElectricityPlan(
             name="UncontrolledPlan",
-            daily_charge=self.daily_charge,
+            daily_charge=cls.daily_charge,
             nzd_per_kwh={
-                "Uncontrolled": self.uncontrolled,
-                "Controlled": self.controlled,
+                "Uncontrolled": cls.uncontrolled,
+                "Controlled": cls.controlled,
             },
         )
-        self.electricity_plan_night_all_inclusive = ElectricityPlan(
+        cls.electricity_plan_night_all_inclusive = ElectricityPlan(
             name="UncontrolledPlan",
-            daily_charge=self.daily_charge,
-            nzd_per_kwh={"Night": self.night, "All inclusive": self.all_inclusive},
+            daily_charge=cls.daily_charge,
+            nzd_per_kwh={"Night": cls.night, "All inclusive": cls.all_inclusive},
         )
-        self.electricity_plan_night_uncontrolled = ElectricityPlan(
+        cls.electricity_plan_night_uncontrolled = ElectricityPlan(
             name="UncontrolledPlan",
-            daily_charge=self.daily_charge,
-            nzd_per_kwh={"Night": self.night, "Uncontrolled": self.uncontrolled},
+            daily_charge=cls.daily_charge,
+            nzd_per_kwh={"Night": cls.night, "Uncontrolled": cls.uncontrolled},
         )
 
     def test_all_inclusive_plan(self):
@@ -246,6 +246,8 @@ class TestElectricityPlan(unittest.TestCase):
         """
         Test with an unexpected key scenario
         """
-        self.electricity_plan_night_uncontrolled.nzd_per_kwh = {"Unexpected": 0.30}
+        plan = self.electricity_plan_night_uncontrolled.model_copy(
+            update={"nzd_per_kwh": {"Unexpected": 0.30}}
+        )
         with self.assertRaises(ValueError):
-            self.electricity_plan_night_uncontrolled.calculate_cost(self.profile)
+            plan.calculate_cost(self.profile)
@@ -21,28 +21,28 @@ household_profile = HouseholdAnswers(
     solar=cfg.get_default_solar_answers(),
 )
 
+energy_usage = estimate_usage_from_profile(household_profile)
+
 
 def test_estimate_usage_from_profile():
     """
     Test the energy usage estimation.
     """
-    energy_usage = estimate_usage_from_profile(household_profile)
     assert energy_usage.elx_connection_days == DAYS_IN_YEAR
     assert energy_usage.flexible_kwh == approx(3618.6299, rel=1e-4)
     assert energy_usage.inflexible_day_kwh == approx(1271.1487, rel=1e-4)
-    assert energy_usage.natural_gas_connection_days == approx(0.0)
-    assert energy_usage.natural_gas_kwh == approx(0.0)
-    assert energy_usage.lpg_tanks_rental_days == approx(0.0)
-    assert energy_usage.lpg_kwh == approx(0.0)
-    assert energy_usage.wood_kwh == approx(0.0)
-    assert energy_usage.petrol_litres == approx(0.0)
-    assert energy_usage.diesel_litres == approx(0.0)
+    assert energy_usage.natural_gas_connection_days == 0
+    assert energy_usage.natural_gas_kwh == 0
+    assert energy_usage.lpg_tanks_rental_days == 0
+    assert energy_usage.lpg_kwh == 0
+    assert energy_usage.wood_kwh == 0
+    assert energy_usage.petrol_litres == 0
+    assert energy_usage.diesel_litres == 0
 
 
 def test_emissions_kg_co2e():
     """
     Test the emissions calculation.
     """
-    energy_usage = estimate_usage_from_profile(household_profile)
     co2_emissions = emissions_kg_co2e(usage_profile=energy_usage)
     assert co2_emissions == approx(566.0142, rel=1e-4)
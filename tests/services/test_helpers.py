@@ -12,6 +12,33 @@ from app.services.helpers import (
     standing_loss_kwh_per_year,
 )
 
+STANDING_LOSS_TECH_TO_SIZE_TO_ANNUAL_KWH = {
+    "Electric hot water cylinder": {
+        1: approx(486.911),
+        2: approx(486.911),
+        3: approx(549.336),
+        4: approx(549.336),
+        5: approx(674.185),
+        6: approx(674.185),
+    },
+    "Piped gas hot water cylinder": {
+        1: approx(2831.232),
+        2: approx(2831.232),
+        3: approx(3147.479),
+        4: approx(3147.479),
+        5: approx(3597.966),
+        6: approx(3597.966),
+    },
+    "Hot water heat pump": {
+        1: approx(1273.8762),
+        2: approx(1273.8762),
+        3: approx(1425.0153),
+        4: approx(1425.0153),
+        5: approx(1503.359),
+        6: approx(1503.359),
+    },
+}
+
 
 def test_add_gst():
     """
@@ -74,36 +101,10 @@ def test_standing_loss_kwh_per_year():
     Test the standing_loss_kwh_per_year hot water energy use function.
     """
     climate_zone = "Wellington"
-    tech_to_size_to_annual_kwh = {
-        "Electric hot water cylinder": {
-            1: approx(486.911),
-            2: approx(486.911),
-            3: approx(549.336),
-            4: approx(549.336),
-            5: approx(674.185),
-            6: approx(674.185),
-        },
-        "Piped gas hot water cylinder": {
-            1: approx(2831.232),
-            2: approx(2831.232),
-            3: approx(3147.479),
-            4: approx(3147.479),
-            5: approx(3597.966),
-            6: approx(3597.966),
-        },
-        "Hot water heat pump": {
-            1: approx(1273.8762),
-            2: approx(1273.8762),
-            3: approx(1425.0153),
-            4: approx(1425.0153),
-            5: approx(1503.359),
-            6: approx(1503.359),
-        },
-    }
     for (
         hot_water_heating_source,
         size_to_annual_kwh,
-    ) in tech_to_size_to_annual_kwh.items():
+    ) in STANDING_LOSS_TECH_TO_SIZE_TO_ANNUAL_KWH.items():
         for household_size, expected_kwh in size_to_annual_kwh.items():
             standing_loss_kwh = standing_loss_kwh_per_year(
                 hot_water_heating_source, household_size, climate_zone